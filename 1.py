@@ -1,16 +1,40 @@
 import csv
+import io
 import os
 import re
 import time
 import traceback
 import threading
+import queue
 from pathlib import Path
 from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import random
 import shutil
 
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
+
+# lxml 是 C 实现的解析器，比标准库 html.parser 快 5-10 倍；未安装时回退
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# pandas 可选：大 title.csv（十万行级）时用 C 层向量化清洗 GOID，
+# 未安装则回退纯 Python 逐行处理
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# polars 可选：跑完后把逐批追加的结果文件一次性批量重写（C 层、带去重）
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -33,12 +57,37 @@ MAX_WORKERS = 3  # 首次登录请改为 1
 
 DELAY_RANGE = (2, 5)  # 随机延迟范围（秒）
 
+CSV_FIELDS = ["goid", "matched_title", "date", "publication", "url", "content", "content_length"]
+
+# 文章正文的候选容器，HTTP 直连解析与浏览器兜底共用同一份选择器
+ARTICLE_SELECTOR = (
+    ".full-text, .document-content, .article-body, "
+    ".article-content, .story-body, div[data-testid='article-body']"
+)
+FLUSH_EVERY = 32  # 每个worker攒多少条结果批量写一次盘
+
 # 为每个线程创建独立的用户目录
 BASE_PROFILE_DIR = str(Path.home() / "proquest_profiles")
 
+# chromedriver 路径在 main() 里解析一次，所有 worker 复用，
+# 避免每个线程都去访问一次 ChromeDriverManager 的网络端点
+CHROMEDRIVER_PATH: Optional[str] = None
+
 # 线程安全的锁
 file_lock = threading.Lock()
-driver_creation_lock = threading.Lock()
+
+# 预编译的正则：这些模式在每行/每个GOID上反复使用，
+# 编译一次省掉 re 模块每次调用的缓存查找
+_DIGIT_RE = re.compile(r"\D")
+_LOGIN_RE = re.compile(r"Sign in|Login|登录|Institution|Shibboleth|机构", re.I)
+
+# CDP 层面拦截的资源：图片/字体/样式和常见统计、广告请求，
+# 每页能少下载几十到上百个子资源
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.css", "*.woff*", "*.ttf",
+    "*google-analytics*", "*doubleclick*", "*/ads/*",
+]
 
 
 # ------------------------------------------------
@@ -49,46 +98,65 @@ def ensure_parent(path_like: str):
 
 
 def setup_driver(worker_id: int, headless: bool = True) -> webdriver.Chrome:
-    """为每个工作线程创建独立的Chrome实例，并禁用图片加载"""
-    with driver_creation_lock:
-        opts = Options()
-        if headless:
-            opts.add_argument("--headless=new")
-
-        # 禁用图片加载以提高速度
-        opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
-
-        opts.add_argument("--window-size=1600,1000")
-        opts.add_argument("--disable-gpu")
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument("--disable-popup-blocking")
-        opts.add_argument("--disable-web-security")
-        opts.add_argument("--disable-features=VizDisplayCompositor")
-
-        # 每个worker使用独立的用户目录
-        profile_dir = f"{BASE_PROFILE_DIR}/worker_{worker_id}"
-        opts.add_argument(f"--user-data-dir={profile_dir}")
-        opts.add_argument("--profile-directory=Default")
-
-        # 随机化User-Agent
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-        ]
-        opts.add_argument(f"--user-agent={random.choice(user_agents)}")
+    """为每个工作线程创建独立的Chrome实例，并禁用图片加载
+
+    driver 路径已在 main() 中解析好，各 worker 可以并行启动，
+    不再需要创建锁和错峰延迟。
+    """
+    opts = Options()
+    if headless:
+        opts.add_argument("--headless=new")
+
+    # 禁用图片加载以提高速度
+    opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    opts.add_argument("--window-size=1600,1000")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--disable-popup-blocking")
+    opts.add_argument("--disable-web-security")
+    opts.add_argument("--disable-features=VizDisplayCompositor,IsolateOrigins,site-per-process")
+
+    # 压内存：每个 worker 一个 Chrome（约 200MB 起步），关掉后台服务、
+    # 扩展和站点隔离，限制渲染进程数，多开 worker 时内存不至于翻倍涨
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-background-networking")
+    opts.add_argument("--disable-default-apps")
+    opts.add_argument("--disable-sync")
+    opts.add_argument("--disable-translate")
+    opts.add_argument("--renderer-process-limit=2")
+    opts.add_argument("--disable-site-isolation-trials")
+
+    # 每个worker使用独立的用户目录
+    profile_dir = f"{BASE_PROFILE_DIR}/worker_{worker_id}"
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+    opts.add_argument("--profile-directory=Default")
+
+    # 随机化User-Agent
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+    ]
+    opts.add_argument(f"--user-agent={random.choice(user_agents)}")
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=opts)
+    driver_path = CHROMEDRIVER_PATH or ChromeDriverManager().install()
+    service = Service(driver_path)
+    driver = webdriver.Chrome(service=service, options=opts)
 
-        # 设置隐式等待
-        driver.implicitly_wait(10)
+    # 在网络层（CDP）屏蔽静态资源，比仅靠 prefs 禁图更彻底
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"Worker-{worker_id}: CDP 资源拦截设置失败（忽略）: {e}")
 
-        # 随机延迟，避免同时启动
-        time.sleep(random.uniform(1, 3))
+    # 不使用隐式等待：隐式等待会叠加在每一次 find_elements 上，
+    # 选择器不命中时每次都要白等 10 秒；统一改用显式 WebDriverWait
+    driver.implicitly_wait(0)
 
-        return driver
+    return driver
 
 
 def wait_ready(drv: webdriver.Chrome, timeout: int = TIMEOUT):
@@ -102,6 +170,9 @@ def wait_ready(drv: webdriver.Chrome, timeout: int = TIMEOUT):
 
 
 def read_goids(csv_path: str) -> List[str]:
+    if pd is not None:
+        return _read_goids_pandas(csv_path)
+
     with open(csv_path, "r", encoding="utf-8", newline="") as f:
         rows = list(csv.reader(f))
     if not rows:
@@ -110,54 +181,97 @@ def read_goids(csv_path: str) -> List[str]:
     has_header = any("goid" in str(c).strip().lower() for c in rows[0])
     start_row = 1 if has_header else 0
 
-    out, seen = [], set()
+    out = []
     for row in rows[start_row:]:
         if not row:
             continue
-        goid_str = row[0] if row else ""
-        g = re.sub(r"\D", "", goid_str)
-        if g and g not in seen:
+        g = _DIGIT_RE.sub("", row[0])
+        if g:
             out.append(g)
-            seen.add(g)
-    return out
+    # dict.fromkeys：保序去重，一趟 C 层循环
+    return list(dict.fromkeys(out))
+
+
+def _read_goids_pandas(csv_path: str) -> List[str]:
+    """向量化版 read_goids：正则清洗和去重都在 C 层完成，不逐行进 Python"""
+    col = pd.read_csv(csv_path, usecols=[0], dtype=str, header=None).iloc[:, 0]
+    if col.empty:
+        return []
+    if "goid" in str(col.iloc[0]).strip().lower():
+        col = col.iloc[1:]
+    col = col.fillna("").str.replace(r"\D", "", regex=True)
+    return col[col != ""].drop_duplicates().tolist()
+
+
+# 在浏览器内一次性查找并点击所有弹窗按钮：单条 WebDriver 命令代替 6 次
+# find_elements 往返，无弹窗时也能立即返回。
+# 用原生正则匹配按钮文本代替 XPath translate() 小写化：
+# translate 是 O(字符数×节点数)，且每个节点都要重算
+_POPUP_JS = """
+var clicked = 0;
+var accept = /accept|同意/i;
+var btns = document.querySelectorAll('button');
+for (var i = 0; i < btns.length; i++) {
+    var b = btns[i];
+    if (b.offsetParent !== null && accept.test(b.innerText)) { b.click(); clicked++; }
+}
+var els = document.querySelectorAll('.modal .close, .modal button.close, .btn-close');
+for (var k = 0; k < els.length; k++) {
+    if (els[k].offsetParent !== null) { els[k].click(); clicked++; }
+}
+return clicked;
+"""
 
 
 def handle_popups(driver: webdriver.Chrome):
     try:
-        for xpath in [
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'accept')]",
-            "//button[contains(., '同意')]",
-            "//button[contains(., '同意所有')]",
-        ]:
-            els = driver.find_elements(By.XPATH, xpath)
-            for e in els:
-                if e.is_displayed():
-                    e.click()
-                    time.sleep(0.5)
-        for sel in [".modal .close", ".modal button.close", ".btn-close"]:
-            els = driver.find_elements(By.CSS_SELECTOR, sel)
-            for e in els:
-                if e.is_displayed():
-                    e.click()
-                    time.sleep(0.3)
+        if driver.execute_script(_POPUP_JS):
+            time.sleep(0.5)
     except Exception:
         pass
 
 
 def on_advanced_search_page(driver: webdriver.Chrome) -> bool:
-    candidates = [
-        (By.ID, "queryTermField"),
-        (By.NAME, "queryTermField"),
-        (By.CSS_SELECTOR, "input#queryTermField, input[name='queryTermField']"),
-    ]
-    for by, val in candidates:
-        try:
-            els = driver.find_elements(by, val)
-            if any(e.is_displayed() for e in els):
-                return True
-        except Exception:
-            continue
-    return False
+    # 一个并集 CSS 选择器即可覆盖 ID/NAME 两种变体，只需一次浏览器往返
+    try:
+        els = driver.find_elements(By.CSS_SELECTOR, "input#queryTermField, input[name='queryTermField']")
+        return any(e.is_displayed() for e in els)
+    except Exception:
+        return False
+
+
+def return_to_advanced(driver: webdriver.Chrome, worker_id: int):
+    """不重新加载整页地回到高级检索页面。
+
+    先走浏览器历史（SPA 内部路由，不重新下载 JS/CSS），再尝试站内的
+    "New Search" 链接，只有都失败时才退回完整的 driver.get。
+    """
+    try:
+        driver.execute_script("window.history.back(); window.history.back();")
+        wait_ready(driver)
+        if on_advanced_search_page(driver):
+            return
+    except Exception:
+        pass
+
+    try:
+        links = driver.find_elements(
+            By.CSS_SELECTOR, "a[href*='/advanced'], a[data-testid='new-search']"
+        )
+        for link in links:
+            if link.is_displayed():
+                link.click()
+                wait_ready(driver)
+                if on_advanced_search_page(driver):
+                    return
+                break
+    except Exception:
+        pass
+
+    print(f"Worker-{worker_id}: 轻量返回失败，重新加载高级检索页面")
+    driver.get(ADVANCED_URL)
+    wait_ready(driver)
+    handle_popups(driver)
 
 
 def ensure_advanced_page(driver: webdriver.Chrome, worker_id: int):
@@ -174,7 +288,7 @@ def ensure_advanced_page(driver: webdriver.Chrome, worker_id: int):
                 return
 
             page = driver.page_source
-            if re.search(r"Sign in|Login|登录|Institution|Shibboleth|机构", page, flags=re.I):
+            if _LOGIN_RE.search(page):
                 print(f"Worker-{worker_id}: 检测到登录页面，无法自动处理。请在有头模式下手动登录。")
                 if not HEADLESS:
                     print("请在打开的浏览器中完成登录，然后手动关闭浏览器或按Ctrl+C停止脚本。")
@@ -191,49 +305,113 @@ def ensure_advanced_page(driver: webdriver.Chrome, worker_id: int):
             time.sleep(random.uniform(2, 4))
 
 
-def extract_first_result_info(page_source: str) -> Optional[Dict[str, str]]:
-    soup = BeautifulSoup(page_source, "html.parser")
-    link = soup.select_one("h3 a, h2 a, a[href*='docview']")
-    if not link:
+# "无结果"判断和首条结果提取都在浏览器内完成：
+# 只回传一个布尔/一个小字典，不再把整页 HTML（常达数百KB）拉回 Python
+_NO_RESULTS_JS = """
+return !!document.querySelector('.no-results, [data-testid="no-results"]') ||
+    /No results|没有找到|0 results/i.test(document.body.innerText.slice(0, 2000));
+"""
+
+_FIRST_RESULT_JS = """
+var link = document.querySelector("h3 a, h2 a, a[href*='docview']");
+if (!link) return null;
+var href = (link.getAttribute('href') || '').trim();
+if (href.indexOf('/') === 0) href = 'https://www.proquest.com' + href;
+var date = '', pub = '';
+var c = link.parentElement;
+if (c) {
+    var d = c.querySelector('.publication-date, .date, [data-testid="publication-date"]');
+    if (d) date = d.innerText.trim();
+    var p = c.querySelector('.publication-title, .source, .pubTitle, .pubtitle');
+    if (p) pub = p.innerText.trim();
+}
+return {title: link.innerText.trim(), link: href, date: date, publication: pub};
+"""
+
+
+def result_page_empty(driver: webdriver.Chrome) -> bool:
+    try:
+        return bool(driver.execute_script(_NO_RESULTS_JS))
+    except Exception:
+        return False
+
+
+def extract_first_result_info(driver: webdriver.Chrome) -> Optional[Dict[str, str]]:
+    try:
+        return driver.execute_script(_FIRST_RESULT_JS)
+    except Exception:
         return None
-    href = link.get("href", "").strip()
-    if href.startswith("/"):
-        href = "https://www.proquest.com" + href
-    title = link.get_text(strip=True)
 
-    date, pub = "", ""
-    container = link.find_parent()
-    if container:
-        dnode = container.select_one(".publication-date, .date, [data-testid='publication-date']")
-        if dnode: date = dnode.get_text(strip=True)
-        pnode = container.select_one(".publication-title, .source, .pubTitle, .pubtitle")
-        if pnode: pub = pnode.get_text(strip=True)
 
-    return {"title": title, "link": href, "date": date, "publication": pub}
+def build_http_session(driver: webdriver.Chrome) -> requests.Session:
+    """用浏览器登录后的 Cookie 构造直连 HTTP 会话
+
+    文章正文通常是服务端渲染的，带 Cookie 的 GET 比开新标签页 + 等待
+    JS 便宜一个数量级；连接池让 TLS 连接跨 GOID 复用（冷握手约
+    100-200ms），瞬时 5xx 由适配器自动退避重试。
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+    # 正文页面文本大，压缩传输能省大半带宽
+    session.headers["Accept-Encoding"] = "gzip, br"
+    sync_session_cookies(session, driver)
+    return session
+
+
+def sync_session_cookies(session: requests.Session, driver: webdriver.Chrome):
+    for c in driver.get_cookies():
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+
+
+def extract_article_body_http(session: requests.Session, url: str, timeout: int = TIMEOUT) -> Optional[str]:
+    """直接 HTTP GET 文章页并本地解析；失败返回 None 交给浏览器兜底"""
+    try:
+        resp = session.get(url, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if resp.status_code != 200 or _LOGIN_RE.search(resp.text[:65536]):
+        return None
+
+    soup = BeautifulSoup(resp.text, HTML_PARSER)
+    node = soup.select_one(ARTICLE_SELECTOR)
+    if node:
+        text = node.get_text("\n", strip=True)
+        if text:
+            return text
+    paras = [p.get_text(strip=True) for p in soup.find_all("p")]
+    paras = [t for t in paras if len(t) > 20]
+    if paras:
+        return "\n".join(paras)
+    return None
 
 
-def extract_article_body(driver: webdriver.Chrome, url: str, timeout: int = TIMEOUT) -> str:
+def extract_article_body_browser(driver: webdriver.Chrome, url: str, timeout: int = TIMEOUT) -> str:
     try:
         orig = driver.current_window_handle
         driver.execute_script("window.open(arguments[0],'_blank');", url)
         driver.switch_to.window(driver.window_handles[-1])
         wait_ready(driver, timeout)
 
-        selectors = [
-            ".full-text", ".document-content", ".article-body",
-            ".article-content", ".story-body", "div[data-testid='article-body']"
-        ]
-        body = ""
-        for sel in selectors:
-            els = driver.find_elements(By.CSS_SELECTOR, sel)
-            if els:
-                body = els[0].text.strip()
-                break
+        # 文本在浏览器内拼好一次性返回：每个 <p> 的 .text 都是一次
+        # WebDriver 往返，长文几十上百段就是几十上百次 RTT
+        body = driver.execute_script(
+            "var e = document.querySelector(arguments[0]);"
+            "return e ? e.innerText.trim() : '';",
+            ARTICLE_SELECTOR,
+        ) or ""
         if not body:
-            ps = driver.find_elements(By.TAG_NAME, "p")
-            paras = [p.text.strip() for p in ps if p.text and len(p.text.strip()) > 20]
-            if paras:
-                body = "\n".join(paras)
+            body = driver.execute_script(
+                "return Array.from(document.querySelectorAll('p'))"
+                ".map(function(p){return p.innerText.trim();})"
+                ".filter(function(t){return t.length > 20;})"
+                ".join('\\n');"
+            ) or ""
 
         driver.close()
         driver.switch_to.window(orig)
@@ -247,82 +425,112 @@ def extract_article_body(driver: webdriver.Chrome, url: str, timeout: int = TIME
         return ""
 
 
-def write_result_to_csv(result_data: Dict, writer: csv.DictWriter):
-    """线程安全地写入CSV"""
+def extract_article_body(driver: webdriver.Chrome, session: Optional[requests.Session],
+                         url: str, timeout: int = TIMEOUT) -> str:
+    """优先走 HTTP 直连，拿不到（403/登录墙/空正文）再回退浏览器标签页"""
+    if session is not None:
+        body = extract_article_body_http(session, url, timeout)
+        if body:
+            return body
+
+    body = extract_article_body_browser(driver, url, timeout)
+    if body and session is not None:
+        # 浏览器能拿到说明会话有效，多半是 Cookie 过期——懒刷新一次
+        try:
+            sync_session_cookies(session, driver)
+        except Exception:
+            pass
+    return body
+
+
+def flush_results(buffer: List[Dict], f_out):
+    """把worker本地缓冲的结果一次性写入CSV（线程安全）
+
+    先在内存里把整批行格式化好，锁内只做一次 write，
+    避免每条结果一次加锁加一次系统调用。
+    """
+    if not buffer:
+        return
+    sio = io.StringIO()
+    writer = csv.DictWriter(sio, fieldnames=CSV_FIELDS)
+    writer.writerows(buffer)
     with file_lock:
-        writer.writerow(result_data)
+        f_out.write(sio.getvalue())
+    buffer.clear()
 
 
-def process_single_goid(driver: webdriver.Chrome, goid: str, worker_id: int, writer: csv.DictWriter) -> Dict:
+def consolidate_results_csv(path: str):
+    """运行结束后把追加式 journal 一次性重写成干净的最终 CSV
+
+    逐批追加的文件在多次续跑后可能含同一 GOID 的多条记录；polars
+    在 C 层完成读取、保序去重（保留最新一条）和批量写出。未安装
+    polars 或任何一步失败时，原样保留 journal，不影响数据。
+    """
+    if pl is None or not os.path.exists(path):
+        return
+    try:
+        df = pl.read_csv(path, infer_schema_length=0)
+        df = df.unique(subset=["goid"], keep="last", maintain_order=True)
+        df.write_csv(path, batch_size=4096)
+        print(f"结果文件已整合：共 {df.height} 行")
+    except Exception as e:
+        print(f"整合结果文件失败（保留原始文件）: {e}")
+
+
+def process_single_goid(driver: webdriver.Chrome, session: Optional[requests.Session],
+                        goid: str, worker_id: int, buffer: List[Dict]) -> Dict:
     """处理单个GOID的完整流程，不重复加载页面"""
     try:
         print(f"Worker-{worker_id}: 开始处理 GOID {goid}")
 
-        # 找到搜索框并输入GOID
-        box = None
-        for by, val in [
-            (By.ID, "queryTermField"),
-            (By.NAME, "queryTermField"),
-            (By.CSS_SELECTOR, "input#queryTermField, input[name='queryTermField']"),
-        ]:
-            try:
-                box = WebDriverWait(driver, TIMEOUT).until(
-                    EC.element_to_be_clickable((by, val))
+        # 找到搜索框并输入GOID（并集选择器一次等待即可，避免逐个候选各等 TIMEOUT）
+        try:
+            box = WebDriverWait(driver, TIMEOUT).until(
+                EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, "input#queryTermField, input[name='queryTermField']")
                 )
-                if box:
-                    break
-            except Exception:
-                continue
-
-        if not box:
+            )
+        except Exception:
             raise RuntimeError("未找到搜索框")
 
         box.clear()
         box.send_keys(goid)
 
-        # 找到搜索按钮并点击
-        btn = None
-        for by, val in [
-            (By.ID, "searchToResultPage"),
-            (By.CSS_SELECTOR, "button#searchToResultPage, button[type='submit']"),
-        ]:
-            try:
-                btn = WebDriverWait(driver, TIMEOUT).until(
-                    EC.element_to_be_clickable((by, val))
+        # 找到搜索按钮并点击（同搜索框：并集选择器一次等待覆盖所有变体，
+        # 避免第一个候选不存在时白等一整个 TIMEOUT）
+        try:
+            btn = WebDriverWait(driver, TIMEOUT).until(
+                EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, "button#searchToResultPage, button[type='submit']")
                 )
-                if btn:
-                    break
-            except Exception:
-                continue
-
-        if not btn:
+            )
+        except Exception:
             raise RuntimeError("未找到搜索按钮")
 
         btn.click()
         wait_ready(driver, TIMEOUT)
         handle_popups(driver)
 
-        src = driver.page_source
-        if re.search(r"No results|没有找到|0 results", src, flags=re.I):
+        if result_page_empty(driver):
             print(f"Worker-{worker_id}: GOID {goid} 无搜索结果")
             result = dict(
                 goid=goid, matched_title="", date="", publication="", url="",
                 content="", content_length=0
             )
-            write_result_to_csv(result, writer)
+            buffer.append(result)
             return result
 
-        info = extract_first_result_info(src)
+        info = extract_first_result_info(driver)
         if not info:
             print(f"Worker-{worker_id}: GOID {goid} 无法解析结果")
             result = dict(
                 goid=goid, matched_title="", date="", publication="", url="",
                 content="", content_length=0
             )
-            write_result_to_csv(result, writer)
+            buffer.append(result)
             return result
 
-        body = extract_article_body(driver, info["link"], TIMEOUT)
+        body = extract_article_body(driver, session, info["link"], TIMEOUT)
 
         result = dict(
             goid=goid,
@@ -334,7 +542,7 @@ def process_single_goid(driver: webdriver.Chrome, goid: str, worker_id: int, wri
             content_length=len(body or "")
         )
 
-        write_result_to_csv(result, writer)
+        buffer.append(result)
         print(f"Worker-{worker_id}: 成功处理 GOID {goid} (正文 {len(body or '')} 字符)")
 
         return result
@@ -347,13 +555,18 @@ def process_single_goid(driver: webdriver.Chrome, goid: str, worker_id: int, wri
             goid=goid, matched_title="ERROR", date="", publication="", url="",
             content=str(e), content_length=0
         )
-        write_result_to_csv(result, writer)
+        buffer.append(result)
         return result
 
 
-def worker_function(goid_batch: List[str], worker_id: int, writer: csv.DictWriter):
-    """工作线程函数，每个线程只初始化一次浏览器实例并登录"""
+def worker_function(goid_queue: "queue.Queue[str]", total: int, worker_id: int, f_out):
+    """工作线程函数，每个线程只初始化一次浏览器实例并登录
+
+    所有 worker 从同一个队列取任务：慢 worker 不会拖着一整块
+    连续分片，先做完的 worker 自然接手剩余任务。
+    """
     driver = None
+    buffer: List[Dict] = []
     try:
         print(f"Worker-{worker_id}: 正在初始化浏览器...")
         driver = setup_driver(worker_id, HEADLESS)
@@ -361,15 +574,35 @@ def worker_function(goid_batch: List[str], worker_id: int, writer: csv.DictWrite
         # 仅在线程启动时检查登录状态并尝试进入高级检索页面
         ensure_advanced_page(driver, worker_id)
 
-        print(f"Worker-{worker_id}: 初始化完成，开始处理 {len(goid_batch)} 个GOIDs")
+        # 登录态就绪后，用浏览器 Cookie 建立直连 HTTP 会话抓正文
+        session = None
+        try:
+            session = build_http_session(driver)
+        except Exception as e:
+            print(f"Worker-{worker_id}: HTTP 会话创建失败，将全程使用浏览器抓取: {e}")
+
+        print(f"Worker-{worker_id}: 初始化完成，开始从队列领取任务")
+
+        done = 0
+        while True:
+            try:
+                goid = goid_queue.get_nowait()
+            except queue.Empty:
+                break
 
-        for i, goid in enumerate(goid_batch, 1):
+            done += 1
             try:
-                print(f"Worker-{worker_id}: [{i}/{len(goid_batch)}] 处理 {goid}")
-                # 在同一个实例上进行后续搜索，不再重复加载页面
-                process_single_goid(driver, goid, worker_id, writer)
+                print(f"Worker-{worker_id}: [剩余{goid_queue.qsize()}/{total}] 处理 {goid}")
+                # 在同一个实例上进行后续搜索，不再重复加载页面；
+                # 如果上一个 GOID 结束后不在检索页，先轻量导航回去
+                if not on_advanced_search_page(driver):
+                    return_to_advanced(driver, worker_id)
+                process_single_goid(driver, session, goid, worker_id, buffer)
+
+                if len(buffer) >= FLUSH_EVERY:
+                    flush_results(buffer, f_out)
 
-                if i < len(goid_batch):
+                if not goid_queue.empty():
                     delay = random.uniform(*DELAY_RANGE)
                     time.sleep(delay)
 
@@ -377,11 +610,18 @@ def worker_function(goid_batch: List[str], worker_id: int, writer: csv.DictWrite
                 print(f"Worker-{worker_id}: 处理 {goid} 时出现异常: {e}")
                 continue
 
+        print(f"Worker-{worker_id}: 共处理 {done} 个GOID")
+
     except Exception as e:
         print(f"Worker-{worker_id}: 线程初始化失败: {e}")
         traceback.print_exc()
 
     finally:
+        # 无论正常结束还是中断，都把剩余缓冲落盘，避免丢行
+        try:
+            flush_results(buffer, f_out)
+        except Exception as e:
+            print(f"Worker-{worker_id}: 写出剩余结果失败: {e}")
         if driver:
             try:
                 driver.quit()
@@ -391,13 +631,6 @@ def worker_function(goid_batch: List[str], worker_id: int, writer: csv.DictWrite
     print(f"Worker-{worker_id}: 完成所有任务")
 
 
-def split_goids_for_workers(goids: List[str], num_workers: int) -> List[List[str]]:
-    """将GOID列表分配给各个工作线程"""
-    chunk_size = (len(goids) + num_workers - 1) // num_workers
-    chunks = [goids[i:i + chunk_size] for i in range(0, len(goids), chunk_size)]
-    return [chunk for chunk in chunks if chunk]
-
-
 def main():
     print("开始运行 ProQuest 爬虫...")
 
@@ -413,27 +646,47 @@ def main():
         print("输入 CSV 中没有有效 GOID")
         return
 
+    # 断点续跑：结果文件里已有的 GOID 不再重复抓取
+    if os.path.exists(OUTPUT_RESULT_CSV):
+        try:
+            with open(OUTPUT_RESULT_CSV, "r", encoding="utf-8-sig", newline="") as f_done:
+                done = {row["goid"] for row in csv.DictReader(f_done)}
+        except Exception as e:
+            print(f"读取已有结果失败，忽略续跑: {e}")
+            done = set()
+        if done:
+            before = len(goids)
+            goids = [g for g in goids if g not in done]
+            print(f"跳过 {before - len(goids)} 个已完成的 GOID")
+        if not goids:
+            print("所有 GOID 均已处理完成")
+            return
+
     print(f"读取到 {len(goids)} 个 GOID，将使用 {MAX_WORKERS} 个并行线程")
 
+    # 提前解析一次 chromedriver，worker 启动时不再各自联网探测
+    global CHROMEDRIVER_PATH
+    CHROMEDRIVER_PATH = ChromeDriverManager().install()
+
+    # 大缓冲打开，每批结果只触发一次 write；不再逐行 flush
     new_file = not os.path.exists(OUTPUT_RESULT_CSV)
-    f_out = open(OUTPUT_RESULT_CSV, "a", encoding="utf-8-sig", newline="")
-    writer = csv.DictWriter(
-        f_out,
-        fieldnames=["goid", "matched_title", "date", "publication", "url", "content", "content_length"]
-    )
+    f_out = open(OUTPUT_RESULT_CSV, "a", encoding="utf-8-sig", newline="", buffering=1 << 16)
     if new_file:
-        writer.writeheader()
+        csv.DictWriter(f_out, fieldnames=CSV_FIELDS).writeheader()
 
     try:
         start_time = time.time()
 
-        goid_chunks = split_goids_for_workers(goids, MAX_WORKERS)
-        print(f"任务分配: {[len(chunk) for chunk in goid_chunks]}")
+        # 共享任务队列代替连续分片，避免某个分片特别慢拖长整体时间
+        goid_queue: "queue.Queue[str]" = queue.Queue()
+        for g in goids:
+            goid_queue.put(g)
 
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        num_workers = min(MAX_WORKERS, len(goids))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
             futures = []
-            for worker_id, goid_batch in enumerate(goid_chunks):
-                future = executor.submit(worker_function, goid_batch, worker_id + 1, writer)
+            for worker_id in range(num_workers):
+                future = executor.submit(worker_function, goid_queue, len(goids), worker_id + 1, f_out)
                 futures.append(future)
 
             for future in as_completed(futures):
@@ -454,6 +707,7 @@ def main():
             f_out.close()
         except Exception:
             pass
+        consolidate_results_csv(OUTPUT_RESULT_CSV)
 
 
 if __name__ == "__main__":